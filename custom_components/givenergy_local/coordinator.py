@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from logging import getLogger
@@ -136,6 +137,7 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
                 await asyncio.sleep(_REFRESH_DELAY_BETWEEN_ATTEMPTS)
                 continue
 
+            self.client.command_builder.mark_refreshed()
             if self.require_full_refresh:
                 self.require_full_refresh = False
                 self.last_full_refresh = datetime.now(UTC)
@@ -195,8 +197,10 @@ class GivEnergyUpdateCoordinator(DataUpdateCoordinator[Plant]):
 
         return True
 
-    async def execute(self, requests: list[TransparentRequest]) -> None:
-        """Execute a set of requests and force an update to read any new values."""
-        self.client.execute(requests, _COMMAND_TIMEOUT, _COMMAND_RETRIES)
-        self.require_full_refresh = True
+    async def execute(self, requests: Sequence[TransparentRequest]) -> None:
+        """Execute a set of requests and force an update to read any new values.
+
+        The client tracks which holding registers were written and re-reads just those
+        on the next refresh, so there's no need to force a full refresh here."""
+        self.client.execute(requests, _COMMAND_TIMEOUT, _COMMAND_RETRIES, optimize=True)
         await self.async_request_refresh()
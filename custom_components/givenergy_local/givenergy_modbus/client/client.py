@@ -1,8 +1,7 @@
 import asyncio
 import logging
-import socket
 from asyncio import Future, Queue, StreamReader, StreamWriter, Task
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from custom_components.givenergy_local.givenergy_modbus.client.commands import (
     CommandBuilder,
@@ -23,6 +22,8 @@ from custom_components.givenergy_local.givenergy_modbus.pdu import (
     TransparentRequest,
     TransparentResponse,
     WriteHoldingRegisterResponse,
+    WriteMultipleHoldingRegistersRequest,
+    WriteMultipleHoldingRegistersResponse,
 )
 from custom_components.givenergy_local.givenergy_modbus.pdu.read_registers import (
     ReadRegistersResponse,
@@ -64,9 +65,8 @@ class Client:
     async def connect(self) -> None:
         """Connect to the remote host and start background tasks."""
         try:
-            connection = asyncio.open_connection(
-                host=self.host, port=self.port, flags=socket.TCP_NODELAY
-            )
+            # asyncio enables TCP_NODELAY on TCP transports itself
+            connection = asyncio.open_connection(host=self.host, port=self.port)
             self.reader, self.writer = await asyncio.wait_for(
                 connection, timeout=self.connect_timeout
             )
@@ -210,12 +210,14 @@ class Client:
                 reqs = self.command_builder.refresh_plant_data(
                     False, self.plant.number_batteries
                 )
-                await self.execute(
+                responses = await self.execute(
                     reqs, timeout=timeout, retries=retries, return_exceptions=True
                 )
+                if not any(isinstance(r, BaseException) for r in responses):
+                    self.command_builder.mark_refreshed()
 
     async def one_shot_command(
-        self, requests: list[TransparentRequest], timeout=1.5, retries=0
+        self, requests: Sequence[TransparentRequest], timeout=1.5, retries=0
     ) -> None:
         """Run a single set of requests and return."""
         await self.connect()
@@ -244,7 +246,13 @@ class Client:
                         "Received unexpected message type for a client: %s", message
                     )
                     continue
-                if isinstance(message, WriteHoldingRegisterResponse):
+                if isinstance(
+                    message,
+                    (
+                        WriteHoldingRegisterResponse,
+                        WriteMultipleHoldingRegistersResponse,
+                    ),
+                ):
                     if message.error:
                         _logger.warning("%s", message)
                     else:
@@ -295,12 +303,24 @@ class Client:
 
     def execute(
         self,
-        requests: list[TransparentRequest],
+        requests: Sequence[TransparentRequest],
         timeout: float,
         retries: int,
         return_exceptions: bool = False,
+        optimize: bool = False,
     ) -> "Future[List[TransparentResponse | BaseException]]":
-        """Helper to perform multiple requests in bulk."""
+        """Helper to perform multiple requests in bulk.
+
+        With optimize set, requests are first coalesced by CommandBuilder.optimize(),
+        so the responses returned correspond to the optimized requests rather than
+        those passed in. Requests are queued together rather than waiting on each
+        response in turn; responses are matched back to requests by shape hash, since
+        the GivEnergy framing has no usable transaction ID."""
+        self.command_builder.mark_written(
+            requests, [0, 60, *self.plant.additional_holding_registers]
+        )
+        if optimize:
+            requests = CommandBuilder.optimize(requests)
         return asyncio.gather(
             *[
                 self.send_request_and_await_response(
@@ -352,6 +372,10 @@ class Client:
                     if response.error:
                         _logger.error("Received error response, retrying: %s", response)
                     else:
+                        if isinstance(request, WriteMultipleHoldingRegistersRequest):
+                            # The response lacks the values written, so apply them
+                            # from the request now the write is acknowledged
+                            self.plant.update(response, request)
                         return response
             except asyncio.TimeoutError:
                 pass
@@ -1,8 +1,8 @@
 """High-level methods for interacting with a remote system."""
 
-from datetime import datetime
-from time import time
-from typing import Optional
+from datetime import datetime, time
+from enum import IntEnum
+from typing import Iterable, Iterator, Optional, Sequence
 
 from typing_extensions import deprecated  # type: ignore[attr-defined]
 
@@ -14,12 +14,98 @@ from custom_components.givenergy_local.givenergy_modbus.model.inverter import (
 from custom_components.givenergy_local.givenergy_modbus.pdu import (
     ReadHoldingRegistersRequest,
     ReadInputRegistersRequest,
+    ReadRegistersRequest,
     TransparentRequest,
     WriteHoldingRegisterRequest,
+    WriteMultipleHoldingRegistersRequest,
 )
 
+# GivEnergy's transparent protocol caps register reads at 60 registers per request,
+# well below the 125 permitted by the Modbus spec. Requests exceeding this are
+# rejected by ReadRegistersRequest.ensure_valid_state().
+MAX_REGISTERS_PER_READ = 60
 
-class RegisterMap:
+
+def _chunk_reads(base_register: int, register_count: int) -> Iterator[tuple[int, int]]:
+    """Split a contiguous register range into (base_register, register_count) reads."""
+    for offset in range(0, register_count, MAX_REGISTERS_PER_READ):
+        yield base_register + offset, min(
+            MAX_REGISTERS_PER_READ, register_count - offset
+        )
+
+
+# Modbus limit for function #16/Write Multiple Holding Registers
+MAX_REGISTERS_PER_WRITE = 123
+
+
+def _write_run(request: TransparentRequest) -> Optional[tuple[int, int, list[int]]]:
+    """Describe a holding register write as (slave_address, base_register, values)."""
+    if isinstance(request, WriteHoldingRegisterRequest):
+        return request.slave_address, request.register, [request.value]
+    if isinstance(request, WriteMultipleHoldingRegistersRequest):
+        return request.slave_address, request.base_register, request.values
+    return None
+
+
+def _merge_writes(
+    first: TransparentRequest, second: TransparentRequest
+) -> Optional[TransparentRequest]:
+    """Merge two writes when the second's registers directly follow the first's."""
+    first_run, second_run = _write_run(first), _write_run(second)
+    if first_run is None or second_run is None:
+        return None
+    slave_address, base_register, values = first_run
+    if (
+        second_run[0] != slave_address
+        or second_run[1] != base_register + len(values)
+        or len(values) + len(second_run[2]) > MAX_REGISTERS_PER_WRITE
+    ):
+        return None
+    return WriteMultipleHoldingRegistersRequest(
+        base_register, values + second_run[2], slave_address=slave_address
+    )
+
+
+def _merge_reads(
+    first: TransparentRequest, second: TransparentRequest
+) -> Optional[TransparentRequest]:
+    """Merge two reads of the same register type that overlap or adjoin.
+
+    Only holding & input register reads are merged (not their subclasses, e.g. the
+    battery-specific reads), and never across a MAX_REGISTERS_PER_READ boundary."""
+    if not (
+        isinstance(first, ReadRegistersRequest)
+        and isinstance(second, ReadRegistersRequest)
+    ):
+        return None
+    if (
+        type(first) not in (ReadHoldingRegistersRequest, ReadInputRegistersRequest)
+        or type(second) is not type(first)
+        or second.slave_address != first.slave_address
+    ):
+        return None
+    first_end = first.base_register + first.register_count
+    second_end = second.base_register + second.register_count
+    if second.base_register > first_end or first.base_register > second_end:
+        return None
+    base_register = min(first.base_register, second.base_register)
+    end = max(first_end, second_end)
+    if base_register // MAX_REGISTERS_PER_READ != (end - 1) // MAX_REGISTERS_PER_READ:
+        return None
+    return type(first)(
+        slave_address=first.slave_address,
+        base_register=base_register,
+        register_count=end - base_register,
+    )
+
+
+def _hhmm(t: time) -> int:
+    """Pack a time of day into the HHMM integer form used by slot registers."""
+    assert 0 <= t.hour < 24 and 0 <= t.minute < 60
+    return t.hour * 100 + t.minute
+
+
+class RegisterMap(IntEnum):
     """Mapping of holding register function to location."""
 
     ENABLE_CHARGE_TARGET = 20
@@ -53,28 +139,179 @@ class RegisterMap:
     BATTERY_PAUSE_SLOT_END = 320
 
 
+# Commands that take no arguments always produce identical requests, so build them
+# once and share them. Encoding a request only refreshes its derived state (the
+# frame builder, raw_frame & check), never the fields that describe the request, so
+# sharing instances between batches is safe.
+_DISABLE_CHARGE_TARGET_REQUESTS = (
+    WriteHoldingRegisterRequest(RegisterMap.ENABLE_CHARGE_TARGET, False),
+    WriteHoldingRegisterRequest(RegisterMap.CHARGE_TARGET_SOC, 100),
+)
+_INVERTER_REBOOT_REQUESTS = (WriteHoldingRegisterRequest(RegisterMap.REBOOT, 100),)
+_CALIBRATE_BATTERY_SOC_REQUESTS = (
+    WriteHoldingRegisterRequest(RegisterMap.SOC_FORCE_ADJUST, 1),
+)
+_DISCHARGE_MODE_MAX_POWER_REQUESTS = (
+    WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 0),
+)
+_DISCHARGE_MODE_TO_MATCH_DEMAND_REQUESTS = (
+    WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1),
+)
+
+
+def _toggle_requests(
+    register: RegisterMap,
+) -> dict[bool, tuple[TransparentRequest, ...]]:
+    """Build the shared requests for both states of an on/off register."""
+    return {
+        enabled: (WriteHoldingRegisterRequest(register, enabled),)
+        for enabled in (False, True)
+    }
+
+
+# On/off registers only ever take one of two values, so share those too.
+_ENABLE_CHARGE_REQUESTS = _toggle_requests(RegisterMap.ENABLE_CHARGE)
+_ENABLE_CHARGE_TARGET_REQUESTS = _toggle_requests(RegisterMap.ENABLE_CHARGE_TARGET)
+_ENABLE_DISCHARGE_REQUESTS = _toggle_requests(RegisterMap.ENABLE_DISCHARGE)
+
+# Bounds-checked single register writes: (register, min, max, error message, whether
+# the value is coerced to int before checking)
+_WRITE_SPECS = {
+    "charge_target_soc": (
+        RegisterMap.CHARGE_TARGET_SOC,
+        4,
+        100,
+        "Charge Target SOC ({val}) must be in [4-100]%",
+        False,
+    ),
+    "soc_reserve": (
+        RegisterMap.BATTERY_SOC_RESERVE,
+        4,
+        100,
+        "Minimum SOC / shallow charge ({val}) must be in [4-100]%",
+        True,
+    ),
+    "charge_limit": (
+        RegisterMap.BATTERY_CHARGE_LIMIT,
+        0,
+        50,
+        "Specified Charge Limit ({val}%) is not in [0-50]%",
+        True,
+    ),
+    "discharge_limit": (
+        RegisterMap.BATTERY_DISCHARGE_LIMIT,
+        0,
+        50,
+        "Specified Discharge Limit ({val}%) is not in [0-50]%",
+        True,
+    ),
+    "power_reserve": (
+        RegisterMap.BATTERY_DISCHARGE_MIN_POWER_RESERVE,
+        4,
+        100,
+        "Battery power reserve ({val}) must be in [4-100]%",
+        True,
+    ),
+    "pause_mode": (
+        RegisterMap.BATTERY_PAUSE_MODE,
+        0,
+        3,
+        "Battery pause mode ({val}) must be in [0-3]",
+        False,
+    ),
+}
+
+
+def _bounded_write(spec_key: str, val: int) -> tuple[TransparentRequest, ...]:
+    """Validate a value against its _WRITE_SPECS entry and build the write request."""
+    register, min_val, max_val, message, coerce = _WRITE_SPECS[spec_key]
+    if coerce:
+        val = int(val)
+    if not min_val <= val <= max_val:
+        raise ValueError(message.format(val=val))
+    return (WriteHoldingRegisterRequest(register, val),)
+
+
 class CommandBuilder:
+    # (start, end) holding registers for each slot, keyed on (discharge, idx)
+    _SLOT_REGISTERS = {
+        (False, 1): (RegisterMap.CHARGE_SLOT_1_START, RegisterMap.CHARGE_SLOT_1_END),
+        (False, 2): (RegisterMap.CHARGE_SLOT_2_START, RegisterMap.CHARGE_SLOT_2_END),
+        (True, 1): (
+            RegisterMap.DISCHARGE_SLOT_1_START,
+            RegisterMap.DISCHARGE_SLOT_1_END,
+        ),
+        (True, 2): (
+            RegisterMap.DISCHARGE_SLOT_2_START,
+            RegisterMap.DISCHARGE_SLOT_2_END,
+        ),
+    }
+    # Resetting a slot has no inputs either, so those requests are shared too
+    _RESET_SLOT_REQUESTS = {
+        key: (
+            WriteHoldingRegisterRequest(hr_start, 0),
+            WriteHoldingRegisterRequest(hr_end, 0),
+        )
+        for key, (hr_start, hr_end) in _SLOT_REGISTERS.items()
+    }
+
     def __init__(self, model: Optional[Model] = None) -> None:
         self.model = model
         if model in [None, Model.ALL_IN_ONE]:
             self.main_slave_address = 0x11
         else:
             self.main_slave_address = 0x32
+        # Holding register blocks written since they were last refreshed
+        self._dirty_holding_blocks: set[int] = set()
+        # Holding register blocks requested by the last refresh_plant_data()
+        self._refreshing_holding_blocks: set[int] = set()
+
+    def mark_written(
+        self, requests: Sequence[TransparentRequest], readable_blocks: Iterable[int]
+    ) -> None:
+        """Note the holding register blocks changed by any write requests.
+
+        The next refresh_plant_data() re-reads those blocks even when it isn't a
+        complete refresh, so written values are picked up without a full refresh.
+        Only blocks in readable_blocks are noted; the inverter may not answer reads of
+        other blocks at all (e.g. the reboot register lives in HR 120-179)."""
+        readable = set(readable_blocks)
+        for request in requests:
+            if isinstance(request, WriteHoldingRegisterRequest):
+                registers = range(request.register, request.register + 1)
+            elif isinstance(request, WriteMultipleHoldingRegistersRequest):
+                registers = range(
+                    request.base_register,
+                    request.base_register + request.register_count,
+                )
+            else:
+                continue
+            self._dirty_holding_blocks.update(
+                readable.intersection(r - r % MAX_REGISTERS_PER_READ for r in registers)
+            )
+
+    def mark_refreshed(self) -> None:
+        """Note that the last refresh_plant_data() requests succeeded.
+
+        Written blocks stay dirty until then, so a failed or retried refresh still
+        re-reads them."""
+        self._dirty_holding_blocks -= self._refreshing_holding_blocks
+        self._refreshing_holding_blocks = set()
 
     def refresh_additional_holding_registers(
         self,
         base_register: int,
-    ) -> list[TransparentRequest]:
+    ) -> tuple[TransparentRequest, ...]:
         """Requests one specific set of holding registers.
         This is intended to be used in cases where registers may or may not be present,
         depending on device capabilities."""
-        return [
+        return (
             ReadHoldingRegistersRequest(
                 slave_address=self.main_slave_address,
                 base_register=base_register,
                 register_count=60,
-            )
-        ]
+            ),
+        )
 
     def refresh_plant_data(
         self,
@@ -82,8 +319,11 @@ class CommandBuilder:
         number_batteries: int = 1,
         max_batteries: int = 5,
         additional_holding_registers: Optional[list[int]] = None,
-    ) -> list[TransparentRequest]:
-        """Refresh plant data."""
+    ) -> tuple[TransparentRequest, ...]:
+        """Refresh plant data.
+
+        All returned requests are independent of each other, so the client may have
+        them in flight concurrently (see Client.execute)."""
         requests: list[TransparentRequest] = [
             ReadInputRegistersRequest(
                 slave_address=self.main_slave_address,
@@ -92,19 +332,13 @@ class CommandBuilder:
             ),
         ]
         if complete:
-            requests.append(
-                ReadHoldingRegistersRequest(
-                    slave_address=self.main_slave_address,
-                    base_register=0,
-                    register_count=60,
-                )
-            )
-            requests.append(
+            requests.extend(
                 ReadHoldingRegistersRequest(
                     slave_address=self.main_slave_address,
-                    base_register=60,
-                    register_count=60,
+                    base_register=base_register,
+                    register_count=register_count,
                 )
+                for base_register, register_count in _chunk_reads(0, 120)
             )
             requests.append(
                 ReadInputRegistersRequest(
@@ -131,234 +365,214 @@ class CommandBuilder:
             for hr in additional_holding_registers:
                 requests.extend(self.refresh_additional_holding_registers(hr))
 
-        return requests
-
-    @staticmethod
-    def disable_charge_target() -> list[TransparentRequest]:
+        # Holding registers only change when written to, so outside of complete
+        # refreshes only re-read the blocks that have been written since last time
+        dirty_blocks = self._dirty_holding_blocks - {
+            r.base_register
+            for r in requests
+            if isinstance(r, ReadHoldingRegistersRequest)
+        }
+        for block in sorted(dirty_blocks):
+            requests.extend(self.refresh_additional_holding_registers(block))
+        self._refreshing_holding_blocks = {
+            r.base_register
+            for r in requests
+            if isinstance(r, ReadHoldingRegistersRequest)
+        }
+
+        return tuple(requests)
+
+    @staticmethod
+    def disable_charge_target() -> tuple[TransparentRequest, ...]:
         """Removes SOC limit and target 100% charging."""
-        return [
-            WriteHoldingRegisterRequest(RegisterMap.ENABLE_CHARGE_TARGET, False),
-            WriteHoldingRegisterRequest(RegisterMap.CHARGE_TARGET_SOC, 100),
-        ]
+        return _DISABLE_CHARGE_TARGET_REQUESTS
 
     @staticmethod
-    def set_charge_target(target_soc: int) -> list[TransparentRequest]:
+    def set_charge_target(target_soc: int) -> tuple[TransparentRequest, ...]:
         """Sets inverter to stop charging when SOC reaches the desired level. Also referred to as "winter mode"."""
-        if not 4 <= target_soc <= 100:
-            raise ValueError(f"Charge Target SOC ({target_soc}) must be in [4-100]%")
-        return [WriteHoldingRegisterRequest(RegisterMap.CHARGE_TARGET_SOC, target_soc)]
+        return _bounded_write("charge_target_soc", target_soc)
 
     @staticmethod
-    def set_enable_charge(enabled: bool) -> list[TransparentRequest]:
+    def set_enable_charge(enabled: bool) -> tuple[TransparentRequest, ...]:
         """Enable the battery to charge, depending on the mode and slots set."""
-        return [WriteHoldingRegisterRequest(RegisterMap.ENABLE_CHARGE, enabled)]
+        return _ENABLE_CHARGE_REQUESTS[bool(enabled)]
 
     @staticmethod
-    def set_enable_charge_target(enabled: bool) -> list[TransparentRequest]:
+    def set_enable_charge_target(enabled: bool) -> tuple[TransparentRequest, ...]:
         """Enable the battery SOC target for charging."""
-        return [WriteHoldingRegisterRequest(RegisterMap.ENABLE_CHARGE_TARGET, enabled)]
+        return _ENABLE_CHARGE_TARGET_REQUESTS[bool(enabled)]
 
     @staticmethod
-    def set_enable_discharge(enabled: bool) -> list[TransparentRequest]:
+    def set_enable_discharge(enabled: bool) -> tuple[TransparentRequest, ...]:
         """Enable the battery to discharge, depending on the mode and slots set."""
-        return [WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, enabled)]
+        return _ENABLE_DISCHARGE_REQUESTS[bool(enabled)]
 
     @staticmethod
-    def set_inverter_reboot() -> list[TransparentRequest]:
+    def set_inverter_reboot() -> tuple[TransparentRequest, ...]:
         """Restart the inverter."""
-        return [WriteHoldingRegisterRequest(RegisterMap.REBOOT, 100)]
+        return _INVERTER_REBOOT_REQUESTS
 
     @staticmethod
-    def set_calibrate_battery_soc() -> list[TransparentRequest]:
+    def set_calibrate_battery_soc() -> tuple[TransparentRequest, ...]:
         """Set the inverter to recalibrate the battery state of charge estimation."""
-        return [WriteHoldingRegisterRequest(RegisterMap.SOC_FORCE_ADJUST, 1)]
+        return _CALIBRATE_BATTERY_SOC_REQUESTS
 
     @staticmethod
     @deprecated("use set_enable_charge(True) instead")
-    def enable_charge() -> list[TransparentRequest]:
+    def enable_charge() -> tuple[TransparentRequest, ...]:
         """Enable the battery to charge, depending on the mode and slots set."""
         return CommandBuilder.set_enable_charge(True)
 
     @staticmethod
     @deprecated("use set_enable_charge(False) instead")
-    def disable_charge() -> list[TransparentRequest]:
+    def disable_charge() -> tuple[TransparentRequest, ...]:
         """Prevent the battery from charging at all."""
         return CommandBuilder.set_enable_charge(False)
 
     @staticmethod
     @deprecated("use set_enable_discharge(True) instead")
-    def enable_discharge() -> list[TransparentRequest]:
+    def enable_discharge() -> tuple[TransparentRequest, ...]:
         """Enable the battery to discharge, depending on the mode and slots set."""
         return CommandBuilder.set_enable_discharge(True)
 
     @staticmethod
     @deprecated("use set_enable_discharge(False) instead")
-    def disable_discharge() -> list[TransparentRequest]:
+    def disable_discharge() -> tuple[TransparentRequest, ...]:
         """Prevent the battery from discharging at all."""
         return CommandBuilder.set_enable_discharge(False)
 
     @staticmethod
-    def set_discharge_mode_max_power() -> list[TransparentRequest]:
+    def set_discharge_mode_max_power() -> tuple[TransparentRequest, ...]:
         """Set the battery discharge mode to maximum power, exporting to the grid if it exceeds load demand."""
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 0)]
+        return _DISCHARGE_MODE_MAX_POWER_REQUESTS
 
     @staticmethod
-    def set_discharge_mode_to_match_demand() -> list[TransparentRequest]:
+    def set_discharge_mode_to_match_demand() -> tuple[TransparentRequest, ...]:
         """Set the battery discharge mode to match demand, avoiding exporting power to the grid."""
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1)]
+        return _DISCHARGE_MODE_TO_MATCH_DEMAND_REQUESTS
 
+    @staticmethod
     @deprecated("Use set_battery_soc_reserve(val) instead")
-    def set_shallow_charge(val: int) -> list[TransparentRequest]:
+    def set_shallow_charge(val: int) -> tuple[TransparentRequest, ...]:
         """Set the minimum level of charge to maintain."""
         return CommandBuilder.set_battery_soc_reserve(val)
 
     @staticmethod
-    def set_battery_soc_reserve(val: int) -> list[TransparentRequest]:
+    def set_battery_soc_reserve(val: int) -> tuple[TransparentRequest, ...]:
         """Set the minimum level of charge to maintain."""
         # TODO what are valid values? 4-100?
-        val = int(val)
-        if not 4 <= val <= 100:
-            raise ValueError(
-                f"Minimum SOC / shallow charge ({val}) must be in [4-100]%"
-            )
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, val)]
+        return _bounded_write("soc_reserve", val)
 
     @staticmethod
-    def set_battery_charge_limit(val: int) -> list[TransparentRequest]:
+    def set_battery_charge_limit(val: int) -> tuple[TransparentRequest, ...]:
         """Set the battery charge power limit as percentage. 50% (2.6 kW) is the maximum for most inverters."""
-        val = int(val)
-        if not 0 <= val <= 50:
-            raise ValueError(f"Specified Charge Limit ({val}%) is not in [0-50]%")
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_CHARGE_LIMIT, val)]
+        return _bounded_write("charge_limit", val)
 
     @staticmethod
-    def set_battery_discharge_limit(val: int) -> list[TransparentRequest]:
+    def set_battery_discharge_limit(val: int) -> tuple[TransparentRequest, ...]:
         """Set the battery discharge power limit as percentage. 50% (2.6 kW) is the maximum for most inverters."""
-        val = int(val)
-        if not 0 <= val <= 50:
-            raise ValueError(f"Specified Discharge Limit ({val}%) is not in [0-50]%")
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_DISCHARGE_LIMIT, val)]
+        return _bounded_write("discharge_limit", val)
 
     @staticmethod
-    def set_battery_power_reserve(val: int) -> list[TransparentRequest]:
+    def set_battery_power_reserve(val: int) -> tuple[TransparentRequest, ...]:
         """Set the battery power reserve to maintain."""
-        val = int(val)
-        if not 4 <= val <= 100:
-            raise ValueError(f"Battery power reserve ({val}) must be in [4-100]%")
-        return [
-            WriteHoldingRegisterRequest(
-                RegisterMap.BATTERY_DISCHARGE_MIN_POWER_RESERVE, val
-            )
-        ]
+        return _bounded_write("power_reserve", val)
 
     @staticmethod
-    def set_battery_pause_mode(val: BatteryPauseMode) -> list[TransparentRequest]:
+    def set_battery_pause_mode(val: BatteryPauseMode) -> tuple[TransparentRequest, ...]:
         """Set the battery pause mode."""
-        if not 0 <= val <= 3:
-            raise ValueError(f"Battery pause mode ({val}) must be in [0-3]")
-        return [WriteHoldingRegisterRequest(RegisterMap.BATTERY_PAUSE_MODE, val)]
+        return _bounded_write("pause_mode", val)
 
     @staticmethod
     def _set_charge_slot(
         discharge: bool, idx: int, slot: Optional[TimeSlot]
-    ) -> list[TransparentRequest]:
-        hr_start, hr_end = (
-            getattr(
-                RegisterMap, f'{"DIS" if discharge else ""}CHARGE_SLOT_{idx}_START'
-            ),
-            getattr(RegisterMap, f'{"DIS" if discharge else ""}CHARGE_SLOT_{idx}_END'),
+    ) -> tuple[TransparentRequest, ...]:
+        if not slot:
+            return CommandBuilder._RESET_SLOT_REQUESTS[(discharge, idx)]
+        hr_start, hr_end = CommandBuilder._SLOT_REGISTERS[(discharge, idx)]
+        return (
+            WriteHoldingRegisterRequest(hr_start, _hhmm(slot.start)),
+            WriteHoldingRegisterRequest(hr_end, _hhmm(slot.end)),
         )
-        if slot:
-            return [
-                WriteHoldingRegisterRequest(hr_start, int(slot.start.strftime("%H%M"))),
-                WriteHoldingRegisterRequest(hr_end, int(slot.end.strftime("%H%M"))),
-            ]
-        else:
-            return [
-                WriteHoldingRegisterRequest(hr_start, 0),
-                WriteHoldingRegisterRequest(hr_end, 0),
-            ]
 
     @staticmethod
-    def set_pause_slot_start(start: Optional[time]) -> list[TransparentRequest]:
+    def set_pause_slot_start(start: Optional[time]) -> tuple[TransparentRequest, ...]:
         if start:
-            return [
+            return (
                 WriteHoldingRegisterRequest(
-                    RegisterMap.BATTERY_PAUSE_SLOT_START, int(start.strftime("%H%M"))
+                    RegisterMap.BATTERY_PAUSE_SLOT_START, _hhmm(start)
                 ),
-            ]
+            )
         else:
-            return [
+            return (
                 WriteHoldingRegisterRequest(RegisterMap.BATTERY_PAUSE_SLOT_START, 0),
-            ]
+            )
 
     @staticmethod
-    def set_pause_slot_end(end: Optional[time]) -> list[TransparentRequest]:
+    def set_pause_slot_end(end: Optional[time]) -> tuple[TransparentRequest, ...]:
         if end:
-            return [
+            return (
                 WriteHoldingRegisterRequest(
-                    RegisterMap.BATTERY_PAUSE_SLOT_END, int(end.strftime("%H%M"))
+                    RegisterMap.BATTERY_PAUSE_SLOT_END, _hhmm(end)
                 ),
-            ]
+            )
         else:
-            return [
-                WriteHoldingRegisterRequest(RegisterMap.BATTERY_PAUSE_SLOT_END, 0),
-            ]
+            return (WriteHoldingRegisterRequest(RegisterMap.BATTERY_PAUSE_SLOT_END, 0),)
 
     @staticmethod
-    def set_charge_slot_1(timeslot: TimeSlot) -> list[TransparentRequest]:
+    def set_charge_slot_1(timeslot: TimeSlot) -> tuple[TransparentRequest, ...]:
         """Set first charge slot start & end times."""
         return CommandBuilder._set_charge_slot(False, 1, timeslot)
 
     @staticmethod
-    def reset_charge_slot_1() -> list[TransparentRequest]:
+    def reset_charge_slot_1() -> tuple[TransparentRequest, ...]:
         """Reset first charge slot to zero/disabled."""
         return CommandBuilder._set_charge_slot(False, 1, None)
 
     @staticmethod
-    def set_charge_slot_2(timeslot: TimeSlot) -> list[TransparentRequest]:
+    def set_charge_slot_2(timeslot: TimeSlot) -> tuple[TransparentRequest, ...]:
         """Set second charge slot start & end times."""
         return CommandBuilder._set_charge_slot(False, 2, timeslot)
 
     @staticmethod
-    def reset_charge_slot_2() -> list[TransparentRequest]:
+    def reset_charge_slot_2() -> tuple[TransparentRequest, ...]:
         """Reset second charge slot to zero/disabled."""
         return CommandBuilder._set_charge_slot(False, 2, None)
 
     @staticmethod
-    def set_discharge_slot_1(timeslot: TimeSlot) -> list[TransparentRequest]:
+    def set_discharge_slot_1(timeslot: TimeSlot) -> tuple[TransparentRequest, ...]:
         """Set first discharge slot start & end times."""
         return CommandBuilder._set_charge_slot(True, 1, timeslot)
 
     @staticmethod
-    def reset_discharge_slot_1() -> list[TransparentRequest]:
+    def reset_discharge_slot_1() -> tuple[TransparentRequest, ...]:
         """Reset first discharge slot to zero/disabled."""
         return CommandBuilder._set_charge_slot(True, 1, None)
 
     @staticmethod
-    def set_discharge_slot_2(timeslot: TimeSlot) -> list[TransparentRequest]:
+    def set_discharge_slot_2(timeslot: TimeSlot) -> tuple[TransparentRequest, ...]:
         """Set second discharge slot start & end times."""
         return CommandBuilder._set_charge_slot(True, 2, timeslot)
 
     @staticmethod
-    def reset_discharge_slot_2() -> list[TransparentRequest]:
+    def reset_discharge_slot_2() -> tuple[TransparentRequest, ...]:
         """Reset second discharge slot to zero/disabled."""
         return CommandBuilder._set_charge_slot(True, 2, None)
 
     @staticmethod
-    def set_system_date_time(dt: datetime) -> list[TransparentRequest]:
+    def set_system_date_time(dt: datetime) -> tuple[TransparentRequest, ...]:
         """Set the date & time of the inverter."""
-        return [
+        return (
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_YEAR, dt.year - 2000),
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MONTH, dt.month),
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_DAY, dt.day),
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_HOUR, dt.hour),
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MINUTE, dt.minute),
             WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_SECOND, dt.second),
-        ]
+        )
 
     @staticmethod
-    def set_mode_dynamic() -> list[TransparentRequest]:
+    def set_mode_dynamic() -> tuple[TransparentRequest, ...]:
         """Set system to Dynamic / Eco mode.
 
         This mode is designed to maximise use of solar generation. The battery will charge from excess solar
@@ -366,7 +580,7 @@ class CommandBuilder:
         avoid importing power. This mode is useful if you want to maximise self-consumption of renewable generation
         and minimise the amount of energy drawn from the grid.
         """
-        # r27=1 r110=4 r59=0
+        # r27=1 r110=4 r59=0 - none are adjacent, so each needs its own request
         return (
             CommandBuilder.set_discharge_mode_to_match_demand()
             + CommandBuilder.set_battery_soc_reserve(4)
@@ -378,7 +592,7 @@ class CommandBuilder:
         discharge_slot_1: TimeSlot = TimeSlot.from_repr(1600, 700),
         discharge_slot_2: Optional[TimeSlot] = None,
         discharge_for_export: bool = False,
-    ) -> list[TransparentRequest]:
+    ) -> tuple[TransparentRequest, ...]:
         """Set system to storage mode with specific discharge slots(s).
 
         This mode stores excess solar generation during the day and holds that energy ready for use later in the day.
@@ -395,15 +609,45 @@ class CommandBuilder:
             ret = CommandBuilder.set_discharge_mode_max_power()  # r27=0
         else:
             ret = CommandBuilder.set_discharge_mode_to_match_demand()  # r27=1
-        ret.extend(CommandBuilder.set_battery_soc_reserve(100))  # r110=100
-        ret.extend(CommandBuilder.set_enable_discharge(True))  # r59=1
-        ret.extend(
-            CommandBuilder.set_discharge_slot_1(discharge_slot_1)
-        )  # r56=1600, r57=700
+        ret += CommandBuilder.set_battery_soc_reserve(100)  # r110=100
+        ret += CommandBuilder.set_enable_discharge(True)  # r59=1
+        # r56=1600, r57=700
+        ret += CommandBuilder.set_discharge_slot_1(discharge_slot_1)
         if discharge_slot_2:
-            ret.extend(
-                CommandBuilder.set_discharge_slot_2(discharge_slot_2)
-            )  # r56=1600, r57=700
+            # r44, r45
+            ret += CommandBuilder.set_discharge_slot_2(discharge_slot_2)
         else:
-            ret.extend(CommandBuilder.reset_discharge_slot_2())
+            ret += CommandBuilder.reset_discharge_slot_2()
         return ret
+
+    @staticmethod
+    def optimize(
+        requests: Sequence[TransparentRequest],
+        merge_writes: bool = False,
+    ) -> tuple[TransparentRequest, ...]:
+        """Coalesce consecutive requests for adjacent registers.
+
+        Requests keep the order they were given in: the inverter applies writes as
+        they arrive and some commands depend on that (e.g. raising the SOC reserve
+        before enabling discharge). Holding & input register reads are merged into an
+        immediately preceding read of the same type and slave where they overlap or
+        adjoin within one MAX_REGISTERS_PER_READ aligned block. Other requests pass
+        through untouched.
+
+        With merge_writes set, a holding register write is also merged into the write
+        immediately before it when both are for the same slave and its registers
+        directly follow on, up to MAX_REGISTERS_PER_WRITE. This relies on the
+        inverter accepting function #16/Write Multiple Holding Registers, which has
+        yet to be confirmed on real hardware, so it is off by default."""
+        optimized: list[TransparentRequest] = []
+        for request in requests:
+            merged = None
+            if optimized:
+                merged = _merge_reads(optimized[-1], request)
+                if merge_writes and not merged:
+                    merged = _merge_writes(optimized[-1], request)
+            if merged:
+                optimized[-1] = merged
+            else:
+                optimized.append(request)
+        return tuple(optimized)
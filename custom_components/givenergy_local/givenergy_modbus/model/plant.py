@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from custom_components.givenergy_local.givenergy_modbus.model import GivEnergyBaseModel
 from custom_components.givenergy_local.givenergy_modbus.model.battery import Battery
@@ -13,8 +13,11 @@ from custom_components.givenergy_local.givenergy_modbus.pdu import (
     NullResponse,
     ReadHoldingRegistersResponse,
     ReadInputRegistersResponse,
+    TransparentRequest,
     TransparentResponse,
     WriteHoldingRegisterResponse,
+    WriteMultipleHoldingRegistersRequest,
+    WriteMultipleHoldingRegistersResponse,
 )
 
 _logger = logging.getLogger(__name__)
@@ -38,8 +41,16 @@ class Plant(GivEnergyBaseModel):
         if not self.register_caches:
             self.register_caches = {0x32: RegisterCache()}
 
-    def update(self, pdu: ClientIncomingMessage):
-        """Update the Plant state from a PDU message."""
+    def update(
+        self,
+        pdu: ClientIncomingMessage,
+        request: Optional[TransparentRequest] = None,
+    ):
+        """Update the Plant state from a PDU message.
+
+        Responses to Write Multiple Holding Registers requests only echo the register
+        range written, so they can only be applied when the originating request is
+        supplied too."""
         if not isinstance(pdu, TransparentResponse):
             _logger.debug(f"Ignoring non-Transparent response {pdu}")
             return
@@ -81,6 +92,16 @@ class Plant(GivEnergyBaseModel):
                 self.register_caches[slave_address].update(
                     {HR(pdu.register): pdu.value}
                 )
+        elif isinstance(pdu, WriteMultipleHoldingRegistersResponse):
+            if isinstance(
+                request, WriteMultipleHoldingRegistersRequest
+            ) and request.expected_response().has_same_shape(pdu):
+                self.register_caches[slave_address].update(
+                    {
+                        HR(k): v
+                        for k, v in enumerate(request.values, start=pdu.base_register)
+                    }
+                )
 
     def detect_batteries(self) -> None:
         """Determine the number of batteries based on whether the register data is valid.
@@ -138,6 +138,7 @@ class TransparentRequest(TransparentMessage, ClientOutgoingMessage, ABC):
             ReadHoldingRegistersRequest,
             ReadInputRegistersRequest,
             WriteHoldingRegisterRequest,
+            WriteMultipleHoldingRegistersRequest,
         )
 
         if transparent_function_code == 3:
@@ -146,6 +147,8 @@ class TransparentRequest(TransparentMessage, ClientOutgoingMessage, ABC):
             return ReadInputRegistersRequest
         elif transparent_function_code == 6:
             return WriteHoldingRegisterRequest
+        elif transparent_function_code == 0x10:
+            return WriteMultipleHoldingRegistersRequest
         elif transparent_function_code == 0x16:
             return ReadBatteryInputRegistersRequest
         else:
@@ -180,6 +183,7 @@ class TransparentResponse(TransparentMessage, ClientIncomingMessage, ABC):
             ReadHoldingRegistersResponse,
             ReadInputRegistersResponse,
             WriteHoldingRegisterResponse,
+            WriteMultipleHoldingRegistersResponse,
         )
 
         if transparent_function_code == 0:
@@ -190,6 +194,8 @@ class TransparentResponse(TransparentMessage, ClientIncomingMessage, ABC):
             return ReadInputRegistersResponse
         elif transparent_function_code == 6:
             return WriteHoldingRegisterResponse
+        elif transparent_function_code == 0x10:
+            return WriteMultipleHoldingRegistersResponse
         else:
             raise NotImplementedError(
                 f"TransparentResponse function #{transparent_function_code} decoder"
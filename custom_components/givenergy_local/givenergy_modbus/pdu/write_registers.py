@@ -1,5 +1,6 @@
-import logging
 from abc import ABC
+import logging
+from typing import Sequence
 
 from custom_components.givenergy_local.givenergy_modbus.codec import (
     PayloadDecoder,
@@ -153,4 +154,137 @@ class WriteHoldingRegisterResponse(WriteHoldingRegister, TransparentResponse):
             _logger.warning(f"{self} is not safe for writing")
 
 
+class WriteMultipleHoldingRegisters(TransparentMessage, ABC):
+    """Request & Response PDUs for function #16/Write Multiple Holding Registers."""
+
+    transparent_function_code = 0x10
+
+    base_register: int
+    register_count: int
+
+    def __init__(self, base_register: int, register_count: int = 0, **kwargs):
+        kwargs["slave_address"] = kwargs.get("slave_address", 0x11)
+        super().__init__(**kwargs)
+        if not isinstance(base_register, int):
+            raise ValueError(f"Register type {type(base_register)} is unacceptable")
+        self.base_register = base_register
+        self.register_count = register_count
+
+    def _extra_shape_hash_keys(self) -> tuple:
+        return super()._extra_shape_hash_keys() + (
+            self.base_register,
+            self.register_count,
+        )
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        if self.base_register is None:
+            raise InvalidPduState("Base register must be set", self)
+        if self.base_register < 0 or 0xFFFF < self.base_register:
+            raise InvalidPduState("Base register must be an unsigned 16-bit int", self)
+        if not self.error and not 1 <= self.register_count <= 123:
+            raise InvalidPduState("Register count must be in [1,123]", self)
+
+
+class WriteMultipleHoldingRegistersRequest(
+    WriteMultipleHoldingRegisters, TransparentRequest
+):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers request messages."""
+
+    values: list[int]
+
+    def __init__(self, base_register: int, values: Sequence[int], **kwargs):
+        super().__init__(base_register, len(values), **kwargs)
+        for value in values:
+            if not isinstance(value, int):
+                raise ValueError(f"Register value {type(value)} is unacceptable")
+        self.values = list(values)
+
+    def __eq__(self, o: object) -> bool:
+        return (
+            isinstance(o, type(self))
+            and self.has_same_shape(o)
+            and o.values == self.values
+        )
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._encode_registers(self._builder)
+        self._update_check_code()
+
+    def _encode_registers(self, builder: PayloadEncoder):
+        builder.add_16bit_uint(self.base_register)
+        builder.add_16bit_uint(self.register_count)
+        builder.add_8bit_uint(2 * self.register_count)
+        [builder.add_16bit_uint(v) for v in self.values]
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteMultipleHoldingRegistersRequest":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        register_count = decoder.decode_16bit_uint()
+        decoder.decode_8bit_uint()  # byte count
+        attrs["values"] = [decoder.decode_16bit_uint() for _ in range(register_count)]
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        for register, value in enumerate(self.values, start=self.base_register):
+            if register not in WRITE_SAFE_REGISTERS:
+                raise InvalidPduState(f"HR({register}) is not safe to write to", self)
+            if not 0 <= value <= 0xFFFF:
+                raise InvalidPduState(
+                    f"Value {value} for HR({register}) must be an unsigned 16-bit int",
+                    self,
+                )
+
+    def _update_check_code(self):
+        crc_builder = PayloadEncoder()
+        crc_builder.add_8bit_uint(self.slave_address)
+        crc_builder.add_8bit_uint(self.transparent_function_code)
+        self._encode_registers(crc_builder)
+        self.check = crc_builder.crc
+        self.check = int.from_bytes(self.check.to_bytes(2, "little"), "big")
+        self._builder.add_16bit_uint(self.check)
+
+    def expected_response(self):
+        return WriteMultipleHoldingRegistersResponse(
+            base_register=self.base_register,
+            register_count=self.register_count,
+            slave_address=self.slave_address,
+        )
+
+
+class WriteMultipleHoldingRegistersResponse(
+    WriteMultipleHoldingRegisters, TransparentResponse
+):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers response messages."""
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._builder.add_16bit_uint(self.base_register)
+        self._builder.add_16bit_uint(self.register_count)
+        self._update_check_code()
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteMultipleHoldingRegistersResponse":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        attrs["register_count"] = decoder.decode_16bit_uint()
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        registers = range(self.base_register, self.base_register + self.register_count)
+        if not self.error and not WRITE_SAFE_REGISTERS.issuperset(registers):
+            _logger.warning(f"{self} is not safe for writing")
+
+
 __all__ = ()
@@ -15,8 +15,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import BATTERY_NOMINAL_VOLTAGE, DOMAIN, Icon
 from .coordinator import GivEnergyUpdateCoordinator
 from .entity import InverterEntity
-from .givenergy_modbus.client.commands import CommandBuilder, RegisterMap
-from .givenergy_modbus.pdu.write_registers import WriteHoldingRegisterRequest
+from .givenergy_modbus.client.commands import CommandBuilder
 
 
 async def async_setup_entry(
@@ -91,13 +90,7 @@ class ACChargeLimitNumber(InverterBasicNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        target_soc = int(value)
-        if not 4 <= target_soc <= 100:
-            raise ValueError(f"Charge Target SOC ({target_soc}) must be in [4-100]%")
-
-        await self.coordinator.execute(
-            [WriteHoldingRegisterRequest(RegisterMap.CHARGE_TARGET_SOC, target_soc)]
-        )
+        await self.coordinator.execute(CommandBuilder.set_charge_target(int(value)))
 
 
 class BatterySoCReserveNumber(InverterBasicNumber):
@@ -1,6 +1,7 @@
 """GivEnergy services."""
 
 import datetime
+from collections.abc import Sequence
 
 from typing import Any
 
@@ -114,7 +115,7 @@ async def _async_get_config_entries(hass: HomeAssistant, device_id: str) -> set[
 
 
 async def _async_service_call(
-    hass: HomeAssistant, device_id: str, commands: list[TransparentRequest]
+    hass: HomeAssistant, device_id: str, commands: Sequence[TransparentRequest]
 ) -> None:
     # Just take the first matching config entry
     # We really shouldn't have multiple entries for the same device ID
@@ -142,8 +143,8 @@ async def _async_activate_mode_timed_discharge(
     end_time = datetime.time.fromisoformat(data[_ATTR_END_TIME])
 
     commands = CommandBuilder.set_discharge_mode_to_match_demand()
-    commands.extend(CommandBuilder.set_enable_discharge(True))
-    commands.extend(CommandBuilder.set_discharge_slot_1(TimeSlot(start_time, end_time)))
+    commands += CommandBuilder.set_enable_discharge(True)
+    commands += CommandBuilder.set_discharge_slot_1(TimeSlot(start_time, end_time))
 
     LOGGER.debug(
         "Activating timed discharge mode between %s and %s", start_time, end_time
@@ -159,8 +160,8 @@ async def _async_activate_mode_timed_export(
     end_time = datetime.time.fromisoformat(data[_ATTR_END_TIME])
 
     commands = CommandBuilder.set_discharge_mode_max_power()
-    commands.extend(CommandBuilder.set_enable_discharge(True))
-    commands.extend(CommandBuilder.set_discharge_slot_1(TimeSlot(start_time, end_time)))
+    commands += CommandBuilder.set_enable_discharge(True)
+    commands += CommandBuilder.set_discharge_slot_1(TimeSlot(start_time, end_time))
 
     LOGGER.debug("Activating timed export mode between %s and %s", start_time, end_time)
     await _async_service_call(hass, data[ATTR_DEVICE_ID], commands)
@@ -178,9 +179,7 @@ async def _async_enable_timed_charge(hass: HomeAssistant, data: dict[str, Any])
     if _ATTR_START_TIME in data and _ATTR_END_TIME in data:
         start_time = datetime.time.fromisoformat(data[_ATTR_START_TIME])
         end_time = datetime.time.fromisoformat(data[_ATTR_END_TIME])
-        commands.extend(
-            CommandBuilder.set_charge_slot_1(TimeSlot(start_time, end_time))
-        )
+        commands += CommandBuilder.set_charge_slot_1(TimeSlot(start_time, end_time))
 
     if _ATTR_CHARGE_TARGET in data:
         target_soc = int(data[_ATTR_CHARGE_TARGET])
@@ -188,8 +187,8 @@ async def _async_enable_timed_charge(hass: HomeAssistant, data: dict[str, Any])
         # If target SOC is 100% with charge target enabled, the inverter unhelpfully
         # bounces between 99-100% in a charge/discharge cycle, so avoid this, matching
         # behaviour of GivEnergy logic.
-        commands.extend(CommandBuilder.set_charge_target(target_soc))
-        commands.extend(CommandBuilder.set_enable_charge_target(target_soc < 100))
+        commands += CommandBuilder.set_charge_target(target_soc)
+        commands += CommandBuilder.set_enable_charge_target(target_soc < 100)
 
     LOGGER.debug("Activating timed charge mode")
     await _async_service_call(hass, data[ATTR_DEVICE_ID], commands)
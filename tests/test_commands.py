@@ -0,0 +1,246 @@
+"""Test CommandBuilder request building, coalescing and written block tracking."""
+
+import pytest
+
+from custom_components.givenergy_local.givenergy_modbus.client.commands import (
+    CommandBuilder,
+    RegisterMap,
+)
+from custom_components.givenergy_local.givenergy_modbus.model import TimeSlot
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ReadHoldingRegistersRequest,
+    ReadInputRegistersRequest,
+    WriteHoldingRegisterRequest,
+    WriteMultipleHoldingRegistersRequest,
+)
+
+
+def _runs(requests):
+    return [
+        (type(r), r.slave_address, r.base_register, r.register_count) for r in requests
+    ]
+
+
+BOUNDED_SETTERS = [
+    (
+        CommandBuilder.set_charge_target,
+        RegisterMap.CHARGE_TARGET_SOC,
+        4,
+        100,
+        "Charge Target SOC ({val}) must be in [4-100]%",
+    ),
+    (
+        CommandBuilder.set_battery_soc_reserve,
+        RegisterMap.BATTERY_SOC_RESERVE,
+        4,
+        100,
+        "Minimum SOC / shallow charge ({val}) must be in [4-100]%",
+    ),
+    (
+        CommandBuilder.set_battery_charge_limit,
+        RegisterMap.BATTERY_CHARGE_LIMIT,
+        0,
+        50,
+        "Specified Charge Limit ({val}%) is not in [0-50]%",
+    ),
+    (
+        CommandBuilder.set_battery_discharge_limit,
+        RegisterMap.BATTERY_DISCHARGE_LIMIT,
+        0,
+        50,
+        "Specified Discharge Limit ({val}%) is not in [0-50]%",
+    ),
+    (
+        CommandBuilder.set_battery_power_reserve,
+        RegisterMap.BATTERY_DISCHARGE_MIN_POWER_RESERVE,
+        4,
+        100,
+        "Battery power reserve ({val}) must be in [4-100]%",
+    ),
+    (
+        CommandBuilder.set_battery_pause_mode,
+        RegisterMap.BATTERY_PAUSE_MODE,
+        0,
+        3,
+        "Battery pause mode ({val}) must be in [0-3]",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("setter", "register", "min_val", "max_val", "message"), BOUNDED_SETTERS
+)
+def test_bounded_setters_accept_boundaries(setter, register, min_val, max_val, message):
+    """Test bounded setters accept both ends of their range."""
+    for val in (min_val, max_val):
+        assert setter(val) == (WriteHoldingRegisterRequest(register, val),)
+
+
+@pytest.mark.parametrize(
+    ("setter", "register", "min_val", "max_val", "message"), BOUNDED_SETTERS
+)
+def test_bounded_setters_reject_out_of_range(
+    setter, register, min_val, max_val, message
+):
+    """Test bounded setters reject values just outside their range."""
+    for val in (min_val - 1, max_val + 1):
+        with pytest.raises(ValueError) as exc_info:
+            setter(val)
+        assert str(exc_info.value) == message.format(val=val)
+
+
+def test_bounded_setters_only_coerce_where_they_always_did():
+    """Test only the setters that historically called int() truncate their input."""
+    assert CommandBuilder.set_battery_soc_reserve(80.9) == (
+        WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 80),
+    )
+    with pytest.raises(ValueError):
+        CommandBuilder.set_charge_target(80.9)
+
+
+def _written_registers(requests):
+    registers = []
+    for r in requests:
+        if isinstance(r, WriteHoldingRegisterRequest):
+            registers.append((r.register, r.value))
+        else:
+            registers.extend(enumerate(r.values, start=r.base_register))
+    return registers
+
+
+def test_optimize_reads_align_to_blocks():
+    """Test merged reads never cross a 60 register block boundary."""
+    requests = CommandBuilder.optimize(
+        [
+            ReadHoldingRegistersRequest(base_register=50, register_count=10),
+            ReadHoldingRegistersRequest(base_register=60, register_count=10),
+            ReadInputRegistersRequest(base_register=0, register_count=30),
+            ReadInputRegistersRequest(base_register=20, register_count=40),
+        ]
+    )
+
+    assert _runs(requests) == [
+        (ReadHoldingRegistersRequest, 0x32, 50, 10),
+        (ReadHoldingRegistersRequest, 0x32, 60, 10),
+        (ReadInputRegistersRequest, 0x32, 0, 60),
+    ]
+
+
+def test_optimize_merges_consecutive_contiguous_writes():
+    """Test back-to-back writes to following registers become one request."""
+    requests = CommandBuilder.optimize(
+        [
+            WriteMultipleHoldingRegistersRequest(94, [100, 200]),
+            WriteHoldingRegisterRequest(96, 300),
+        ],
+        merge_writes=True,
+    )
+
+    assert requests == (WriteMultipleHoldingRegistersRequest(94, [100, 200, 300]),)
+
+
+def test_optimize_preserves_write_order():
+    """Test writes are sent in the order given, even when registers would adjoin."""
+    requests = [
+        WriteHoldingRegisterRequest(95, 300),
+        WriteHoldingRegisterRequest(110, 4),
+        WriteHoldingRegisterRequest(94, 100),
+    ]
+
+    assert CommandBuilder.optimize(requests, merge_writes=True) == tuple(requests)
+
+
+def test_optimize_preserves_set_mode_storage_order():
+    """Test the SOC reserve is still raised before discharge is enabled."""
+    requests = CommandBuilder.set_mode_storage(
+        TimeSlot.from_repr(1600, 700), TimeSlot.from_repr(1900, 2000)
+    )
+
+    assert _written_registers(CommandBuilder.optimize(requests, merge_writes=True)) == (
+        _written_registers(requests)
+    )
+
+
+def test_optimize_leaves_writes_alone_by_default():
+    """Test writes are not merged unless asked to."""
+    requests = CommandBuilder.set_discharge_slot_1(TimeSlot.from_repr(1600, 700))
+
+    assert CommandBuilder.optimize(requests) == requests
+
+
+def test_optimize_single_register_write_is_unchanged():
+    """Test a lone register write stays a Write Single Holding Register request."""
+    requests = CommandBuilder.optimize([WriteHoldingRegisterRequest(96, 1)])
+
+    assert requests == (WriteHoldingRegisterRequest(96, 1),)
+
+
+def test_optimize_writes_capped_at_123_registers():
+    """Test long contiguous writes are split into requests of at most 123 registers."""
+    requests = CommandBuilder.optimize(
+        [WriteHoldingRegisterRequest(r, 0) for r in range(130)], merge_writes=True
+    )
+
+    assert [(r.base_register, r.register_count) for r in requests] == [
+        (0, 123),
+        (123, 7),
+    ]
+
+
+def test_optimize_keeps_slaves_separate():
+    """Test requests to different slaves are never merged."""
+    requests = CommandBuilder.optimize(
+        [
+            ReadInputRegistersRequest(
+                base_register=60, register_count=60, slave_address=0x32
+            ),
+            ReadInputRegistersRequest(
+                base_register=60, register_count=60, slave_address=0x33
+            ),
+            WriteHoldingRegisterRequest(94, 1, slave_address=0x11),
+            WriteHoldingRegisterRequest(95, 2, slave_address=0x32),
+        ],
+        merge_writes=True,
+    )
+
+    assert _runs(requests[:2]) == [
+        (ReadInputRegistersRequest, 0x32, 60, 60),
+        (ReadInputRegistersRequest, 0x33, 60, 60),
+    ]
+    assert requests[2:] == (
+        WriteHoldingRegisterRequest(94, 1, slave_address=0x11),
+        WriteHoldingRegisterRequest(95, 2, slave_address=0x32),
+    )
+
+
+def test_mark_written_only_marks_readable_blocks():
+    """Test writes outside the blocks the plant reads don't trigger re-reads."""
+    builder = CommandBuilder()
+    builder.mark_written(
+        CommandBuilder.set_charge_target(80) + CommandBuilder.set_inverter_reboot(),
+        [0, 60],
+    )
+
+    requests = builder.refresh_plant_data(False)
+
+    assert [
+        r.base_register for r in requests if isinstance(r, ReadHoldingRegistersRequest)
+    ] == [60]
+
+
+def test_written_blocks_reread_until_refreshed():
+    """Test written blocks are re-read until a refresh is acknowledged."""
+    builder = CommandBuilder()
+    builder.mark_written(CommandBuilder.set_charge_target(80), [0, 60])
+
+    def holding_blocks():
+        return [
+            r.base_register
+            for r in builder.refresh_plant_data(False)
+            if isinstance(r, ReadHoldingRegistersRequest)
+        ]
+
+    assert holding_blocks() == [60]
+    assert holding_blocks() == [60]
+    builder.mark_refreshed()
+    assert holding_blocks() == []
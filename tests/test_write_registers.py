@@ -0,0 +1,62 @@
+"""Test the Write Multiple Holding Registers PDUs."""
+
+from custom_components.givenergy_local.givenergy_modbus.model.plant import Plant
+from custom_components.givenergy_local.givenergy_modbus.model.register import HR
+from custom_components.givenergy_local.givenergy_modbus.pdu import (
+    ClientIncomingMessage,
+    ClientOutgoingMessage,
+    WriteMultipleHoldingRegistersRequest,
+    WriteMultipleHoldingRegistersResponse,
+)
+
+
+def test_request_round_trip():
+    """Test a request decodes back to the request that was encoded."""
+    request = WriteMultipleHoldingRegistersRequest(
+        94, [30, 430], data_adapter_serial_number="AB1234G567"
+    )
+
+    decoded = ClientOutgoingMessage.decode_bytes(request.encode())
+
+    assert isinstance(decoded, WriteMultipleHoldingRegistersRequest)
+    assert decoded == request
+    assert decoded.base_register == 94
+    assert decoded.register_count == 2
+    assert decoded.values == [30, 430]
+
+
+def test_response_round_trip():
+    """Test a response decodes back to the shape the request expects."""
+    request = WriteMultipleHoldingRegistersRequest(94, [30, 430])
+    response = WriteMultipleHoldingRegistersResponse(
+        94,
+        2,
+        data_adapter_serial_number="AB1234G567",
+        inverter_serial_number="SA1234G567",
+    )
+
+    decoded = ClientIncomingMessage.decode_bytes(response.encode())
+
+    assert isinstance(decoded, WriteMultipleHoldingRegistersResponse)
+    assert decoded.base_register == 94
+    assert decoded.register_count == 2
+    assert request.expected_response().has_same_shape(decoded)
+
+
+def test_plant_update_uses_request_values():
+    """Test an acknowledged write updates the register cache from the request."""
+    plant = Plant()
+    request = WriteMultipleHoldingRegistersRequest(94, [30, 430])
+    response = WriteMultipleHoldingRegistersResponse(
+        94,
+        2,
+        data_adapter_serial_number="AB1234G567",
+        inverter_serial_number="SA1234G567",
+    )
+
+    plant.update(response)
+    assert HR(94) not in plant.register_caches[0x32]
+
+    plant.update(response, request)
+    assert plant.register_caches[0x32][HR(94)] == 30
+    assert plant.register_caches[0x32][HR(95)] == 430